@@ -21,7 +21,8 @@ This matches the identity when stD_bps = Min Target and gammaScale=1:
   term2 = term3 = δ_bps / 2  ⇒  δ* = δ_bps, SPREAD = 2*δ_bps
 """
 
-from typing import List, Tuple
+import sys
+from typing import Final, List, Tuple
 
 
 LEVELS_BPS: List[float] = [
@@ -30,17 +31,38 @@ LEVELS_BPS: List[float] = [
 
 
 def build_rows(gamma_scale: float = 1.0, stdev_equals_target: bool = True) -> List[Tuple[str, ...]]:
+    if gamma_scale == 1.0 and stdev_equals_target:
+        # Documented identity: term2 = term3 = δ_bps / 2, δ* = δ_bps, q*gam*stD^2 = δ_bps
+        return [
+            (
+                f"{d_bps:g}",
+                f"{d_bps:g}",
+                f"{1.0 / d_bps:.6f}",
+                f"{1.0 / d_bps:.6f}",
+                f"{d_bps:.2f}",
+                f"{d_bps / 2.0:.2f}",
+                f"{d_bps / 2.0:.2f}",
+                f"{d_bps:.2f}",
+                "1",
+                f"{d_bps:.0f}",
+                f"{2.0 * d_bps:,.2f}",
+            )
+            for d_bps in LEVELS_BPS
+        ]
+
     rows: List[Tuple[str, ...]] = []
     for d_bps in LEVELS_BPS:
         stdev_bps = d_bps if stdev_equals_target else d_bps
+        sig2 = stdev_bps * stdev_bps
         k_small = 1.0 / d_bps
+        k2 = k_small * k_small
         gamma = gamma_scale * k_small
-        inv_k = 1.0 / k_small  # equals d_bps
-        term2 = gamma / (2.0 * k_small * k_small)
-        term3 = (gamma * (stdev_bps ** 2)) / 2.0
+        inv_k = d_bps  # 1 / k_small
+        term2 = gamma / (2.0 * k2)
+        term3 = gamma * sig2 * 0.5
         delta_star = inv_k - term2 + term3
         q = 1.0
-        q_gamma_sigma2 = gamma * (stdev_bps ** 2)
+        q_gamma_sigma2 = gamma * sig2
         spread = 2.0 * delta_star
 
         # Format to match sheet look-and-feel
@@ -62,31 +84,28 @@ def build_rows(gamma_scale: float = 1.0, stdev_equals_target: bool = True) -> Li
     return rows
 
 
+HEADERS: Final = (
+    "Min Target",
+    "stD",
+    "k",
+    "gamma",
+    "1/k",
+    "+gam/(2*k^2)",
+    "+(gam*stD^2)/2",
+    "optimal half spread",
+    "q (inventory)",
+    "q*gam*stD^2",
+    "SPREAD",
+)
+
+
 def render_table(rows: List[Tuple[str, ...]]) -> None:
-    headers = (
-        "Min Target",
-        "stD",
-        "k",
-        "gamma",
-        "1/k",
-        "+gam/(2*k^2)",
-        "+(gam*stD^2)/2",
-        "optimal half spread",
-        "q (inventory)",
-        "q*gam*stD^2",
-        "SPREAD",
-    )
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(cell))
-    def fmt_row(vals):
-        return " | ".join(val.rjust(col_widths[i]) for i, val in enumerate(vals))
+    col_widths = [max(map(len, col)) for col in zip(HEADERS, *rows)]
+    row_fmt = " | ".join("{:>" + str(w) + "}" for w in col_widths)
     sep = "-+-".join("-" * w for w in col_widths)
-    print(fmt_row(headers))
-    print(sep)
-    for row in rows:
-        print(fmt_row(row))
+    lines = [row_fmt.format(*HEADERS), sep]
+    lines.extend(row_fmt.format(*row) for row in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
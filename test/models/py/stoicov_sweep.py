@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+"""
+Parallel numba kernel behind stoicov_sim.scenario_grid for large multi-level sweeps.
+
+Kept in its own module so numba is only imported (and the kernel only compiled)
+when a sweep is big enough to benefit; see stoicov_sim._PARALLEL_SWEEP_MIN_POINTS.
+"""
+
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def sweep(levels, k_values, sigma_mults, gamma_scales, severities, tau, out):
+    # Levels are independent, so they are split across threads
+    for li in prange(len(levels)):
+        level_bps = levels[li]
+        k = k_values[li]
+        inv_k = 1.0 / k
+        half_inv_k2 = 0.5 * inv_k * inv_k
+        for mi in range(len(sigma_mults)):
+            m = sigma_mults[mi]
+            sigma = (level_bps / 10000.0) * m  # sigma_from_stdev_bps(level_bps * m)
+            sig2_tau = sigma * sigma * tau
+            for gi in range(len(gamma_scales)):
+                gs = gamma_scales[gi]
+                gamma = gs * k
+                delta = inv_k - gamma * half_inv_k2 + 0.5 * gamma * sig2_tau
+                for si in range(len(severities)):
+                    s = severities[si]
+                    q = 0.0 if gamma == 0 else s / (gamma * sigma * tau)
+                    shift = - q * gamma * sig2_tau  # negative for undesired inventory
+                    row = out[li, mi, gi, si]
+                    row[0] = level_bps
+                    row[1] = level_bps * m
+                    row[2] = gs
+                    row[3] = s
+                    row[4] = delta * 1e4
+                    row[5] = shift * 1e4
+                    row[6] = (-delta + shift) * 1e4
+                    row[7] = ( delta + shift) * 1e4
+                    row[8] = 2 * delta * 1e4
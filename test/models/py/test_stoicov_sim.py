@@ -0,0 +1,189 @@
+"""
+Behaviour checks for stoicov_sim: scenario_grid against the original per-point loop
+and the printed 30 bps example, and the inventory-mode dispatch in q_from_balances.
+
+Run from the repo root:
+  python -m pytest test/models/py
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+import stoicov_sim
+
+
+SIGMA_MULTS = (0.5, 1.0, 2.0)
+GAMMA_SCALES = (0.0, 0.5, 1.0)
+SEVERITIES = (0.0, 0.5, 1.0)
+
+
+def baseline_rows(level_bps, sigma_mults, gamma_scales, severities, tau=1.0):
+    # The original scenario_table triple loop, rebuilt on the retained scalar helpers
+    k = stoicov_sim.k_from_level_bps(level_bps)
+    base_sigma = stoicov_sim.sigma_from_stdev_bps(level_bps)
+    rows = []
+    for m in sigma_mults:
+        sigma = base_sigma * m
+        for gs in gamma_scales:
+            gamma = stoicov_sim.gamma_from_scale(gs, k)
+            delta = stoicov_sim.delta_star_taylor(k, gamma, sigma, tau)
+            for s in severities:
+                q = 0.0 if gamma == 0 else s / (gamma * sigma * tau)
+                shift = stoicov_sim.reservation_shift(q, gamma, sigma, tau)
+                rows.append((
+                    level_bps,
+                    level_bps * m,
+                    gs,
+                    s,
+                    delta * 1e4,
+                    shift * 1e4,
+                    (-delta + shift) * 1e4,
+                    (delta + shift) * 1e4,
+                    2 * delta * 1e4,
+                ))
+    return rows
+
+
+@pytest.mark.parametrize("tau", [1.0, 0.25])
+def test_grid_matches_baseline_loop_for_all_levels(tau):
+    grid = stoicov_sim.scenario_grid(stoicov_sim.LEVELS_BPS, SIGMA_MULTS, GAMMA_SCALES, SEVERITIES, tau)
+    expected = [
+        row
+        for level_bps in stoicov_sim.LEVELS_BPS
+        for row in baseline_rows(level_bps, SIGMA_MULTS, GAMMA_SCALES, SEVERITIES, tau)
+    ]
+    # atol covers ask offsets that cancel to ~0 at 500 bps
+    np.testing.assert_allclose(grid, np.array(expected), rtol=1e-12, atol=1e-9)
+
+
+def test_scenario_table_prints_baseline_30bps_rows(capsys):
+    # Rows of the original example_30bps output (γ ≠ 0, so δ* and the shift both move)
+    expected = [
+        ["30.0", "15.0", "0.50", "0.5", "24.40", "-7.50", "-31.90", "16.90", "48.79"],
+        ["30.0", "30.0", "1.00", "1.0", "30.00", "-30.00", "-60.00", "0.00", "60.00"],
+        ["30.0", "60.0", "0.50", "1.0", "52.49", "-60.00", "-112.49", "-7.51", "104.99"],
+        ["30.0", "60.0", "1.00", "0.5", "74.96", "-30.00", "-104.96", "44.96", "149.91"],
+    ]
+    stoicov_sim.scenario_table(30.0, SIGMA_MULTS, GAMMA_SCALES, SEVERITIES)
+    printed = [[cell.strip() for cell in line.split(" | ")] for line in capsys.readouterr().out.splitlines()[2:]]
+    for row in expected:
+        assert row in printed
+
+
+def test_grid_flattens_level_sigma_gamma_severity():
+    levels = (1.0, 30.0, 150.0)
+    grid = stoicov_sim.scenario_grid(levels, SIGMA_MULTS, GAMMA_SCALES, SEVERITIES)
+    cube = grid.reshape(len(levels), len(SIGMA_MULTS), len(GAMMA_SCALES), len(SEVERITIES), -1)
+
+    for li, level_bps in enumerate(levels):
+        np.testing.assert_array_equal(
+            cube[li].reshape(-1, grid.shape[1]),
+            stoicov_sim.scenario_grid((level_bps,), SIGMA_MULTS, GAMMA_SCALES, SEVERITIES),
+        )
+        for mi, m in enumerate(SIGMA_MULTS):
+            for gi, gs in enumerate(GAMMA_SCALES):
+                for si, s in enumerate(SEVERITIES):
+                    assert cube[li, mi, gi, si, :4].tolist() == [level_bps, level_bps * m, gs, s]
+
+
+def test_zero_gamma_has_no_inventory_shift():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        grid = stoicov_sim.scenario_grid((30.0,), SIGMA_MULTS, (0.0,), SEVERITIES)
+
+    k = stoicov_sim.k_from_level_bps(30.0)
+    delta_bps, shift_bps, bid_off, ask_off = grid[:, 4], grid[:, 5], grid[:, 6], grid[:, 7]
+    np.testing.assert_allclose(delta_bps, 1e4 / k)
+    assert np.all(shift_bps == 0.0)
+    np.testing.assert_allclose(bid_off, -delta_bps)
+    np.testing.assert_allclose(ask_off, delta_bps)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"levels": (30.0, 0.0)},
+        {"levels": (30.0,), "sigma_mults": (0.0, 1.0)},
+        {"levels": (30.0,), "tau": 0.0},
+    ],
+)
+def test_grid_rejects_degenerate_inputs(kwargs):
+    with pytest.raises(ValueError):
+        stoicov_sim.scenario_grid(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "sigma_mults, gamma_scales, tau",
+    [
+        ((0.0, 1.0), (0.0,), 1.0),
+        (SIGMA_MULTS, (0.0,), 0.0),
+        ((-1.0, 1.0), GAMMA_SCALES, 1.0),
+        (SIGMA_MULTS, GAMMA_SCALES, -0.5),
+    ],
+)
+def test_grid_accepts_inputs_the_original_loop_computed(sigma_mults, gamma_scales, tau):
+    grid = stoicov_sim.scenario_grid((30.0,), sigma_mults, gamma_scales, SEVERITIES, tau)
+    assert np.all(np.isfinite(grid))
+    np.testing.assert_allclose(
+        grid,
+        np.array(baseline_rows(30.0, sigma_mults, gamma_scales, SEVERITIES, tau)),
+        rtol=1e-12,
+        atol=1e-9,
+    )
+
+
+def test_parallel_sweep_matches_numpy_path():
+    stoicov_sweep = pytest.importorskip("stoicov_sweep")
+    levels = np.asarray(stoicov_sim.LEVELS_BPS, dtype=np.float64)
+    k = np.array([stoicov_sim.k_from_level_bps(lvl) for lvl in stoicov_sim.LEVELS_BPS], dtype=np.float64)
+    mults, scales, sevs = (np.asarray(v, dtype=np.float64) for v in (SIGMA_MULTS, GAMMA_SCALES, SEVERITIES))
+
+    out = np.empty((len(levels), len(mults), len(scales), len(sevs), len(stoicov_sim.SCENARIO_HEADERS)))
+    stoicov_sweep.sweep(levels, k, mults, scales, sevs, 1.0, out)
+
+    np.testing.assert_array_equal(
+        out.reshape(-1, len(stoicov_sim.SCENARIO_HEADERS)),
+        stoicov_sim.scenario_grid(stoicov_sim.LEVELS_BPS, SIGMA_MULTS, GAMMA_SCALES, SEVERITIES),
+    )
+
+
+def test_scenario_grid_hands_off_to_parallel_sweep(monkeypatch):
+    stoicov_sweep = pytest.importorskip("stoicov_sweep")
+    kernel, calls = stoicov_sweep.sweep, []
+    monkeypatch.setattr(stoicov_sweep, "sweep", lambda *args: calls.append(args) or kernel(*args))
+    monkeypatch.setattr(stoicov_sim, "_PARALLEL_SWEEP_MIN_POINTS", 0)
+    levels = np.asarray(stoicov_sim.LEVELS_BPS, dtype=np.float64)
+    k = np.array([stoicov_sim.k_from_level_bps(lvl) for lvl in stoicov_sim.LEVELS_BPS], dtype=np.float64)
+    mults, scales, sevs = (np.asarray(v, dtype=np.float64) for v in (SIGMA_MULTS, GAMMA_SCALES, SEVERITIES))
+
+    grid = stoicov_sim.scenario_grid(stoicov_sim.LEVELS_BPS, SIGMA_MULTS, GAMMA_SCALES, SEVERITIES)
+
+    assert len(calls) == 1
+    np.testing.assert_allclose(
+        grid,
+        stoicov_sim._broadcast_grid(levels, k, mults, scales, sevs, 1.0),
+        rtol=1e-12,
+        atol=1e-9,
+    )
+
+
+@pytest.mark.parametrize(
+    "name, member, expected",
+    [
+        ("no_inventory", stoicov_sim.InventoryMode.NO_INVENTORY, 0.0),
+        ("risky0_zero", stoicov_sim.InventoryMode.RISKY0_ZERO, 3.0),
+        ("risky1_zero", stoicov_sim.InventoryMode.RISKY1_ZERO, 2.5),
+        ("value_neutral", stoicov_sim.InventoryMode.VALUE_NEUTRAL, 0.5),
+    ],
+)
+def test_q_from_balances_accepts_names_members_and_codes(name, member, expected):
+    for mode in (name, member, int(member)):
+        assert stoicov_sim.q_from_balances(mode, 3.0, 10.0, 4.0) == expected
+
+
+@pytest.mark.parametrize("mode", ["bogus", 7, None, True, 2.0, [1]])
+def test_q_from_balances_rejects_unknown_modes(mode):
+    with pytest.raises(ValueError, match="unknown inventory mode"):
+        stoicov_sim.q_from_balances(mode, 3.0, 10.0, 4.0)